@@ -11,7 +11,7 @@ import typing
 import threading
 from six.moves.queue import Queue
 
-from .copy import copy_file_internal, copy_modified_time
+from .copy import _copy_local_file_data, copy_file_internal, copy_modified_time
 from .errors import BulkCopyFailed
 from .tools import copy_file_data
 
@@ -58,15 +58,19 @@ class _Task(object):
 class _CopyTask(_Task):
     """A callable that copies from one file another."""
 
-    def __init__(self, src_file, dst_file):
-        # type: (IO, IO) -> None
+    def __init__(self, src_file, dst_file, local=False):
+        # type: (IO, IO, bool) -> None
         self.src_file = src_file
         self.dst_file = dst_file
+        self.local = local
 
     def __call__(self):
         # type: () -> None
         try:
-            copy_file_data(self.src_file, self.dst_file, chunk_size=1024 * 1024)
+            if self.local:
+                _copy_local_file_data(self.src_file, self.dst_file)
+            else:
+                copy_file_data(self.src_file, self.dst_file, chunk_size=1024 * 1024)
         finally:
             try:
                 self.src_file.close()
@@ -152,5 +156,6 @@ class Copier(object):
             except Exception:
                 src_file.close()
                 raise
-            task = _CopyTask(src_file, dst_file)
+            local = src_fs.hassyspath(src_path) and dst_fs.hassyspath(dst_path)
+            task = _CopyTask(src_file, dst_file, local=local)
             self.queue.put(task)
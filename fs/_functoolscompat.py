@@ -0,0 +1,28 @@
+# mypy: ignore-errors
+try:
+    from functools import lru_cache
+except ImportError:
+    from functools import wraps
+
+    from .lrucache import LRUCache
+
+    # Python 2 has no `functools.lru_cache`: provide a minimal version
+    # supporting positional arguments only, backed by an `LRUCache`.
+
+    def lru_cache(maxsize=128):
+        """Cache the results of a function with positional arguments."""
+
+        def decorator(func):
+            cache = LRUCache(maxsize)
+
+            @wraps(func)
+            def wrapper(*args):
+                try:
+                    return cache[args]
+                except KeyError:
+                    result = cache[args] = func(*args)
+                    return result
+
+            return wrapper
+
+        return decorator
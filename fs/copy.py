@@ -5,22 +5,48 @@ from __future__ import print_function, unicode_literals
 
 import typing
 
+import errno
+import io
+import os
+import stat
 import warnings
 
 from .errors import ResourceNotFound
 from .opener import manage_fs
-from .path import abspath, combine, frombase, normpath
-from .tools import is_thread_safe
+from .path import abspath, combine, dirname, frombase, normpath
+from .tools import copy_file_data, is_thread_safe
 from .walk import Walker
 
+try:
+    from os import sendfile
+except ImportError:
+    try:
+        from sendfile import sendfile  # type: ignore
+    except ImportError:
+        sendfile = None  # type: ignore  # pragma: no cover
+
 if typing.TYPE_CHECKING:
-    from typing import Callable, Optional, Text, Union
+    from typing import IO, Callable, Optional, Text, Union
 
     from .base import FS
 
     _OnCopy = Callable[[FS, Text, FS, Text], object]
 
 
+_SENDFILE_ERROR_CODES = {
+    errno.EIO,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EBADF,
+    errno.ENOTSOCK,
+    errno.EOPNOTSUPP,
+}
+
+# PyPy doesn't define ENOTSUP so we have to add it conditionally.
+if hasattr(errno, "ENOTSUP"):
+    _SENDFILE_ERROR_CODES.add(errno.ENOTSUP)
+
+
 def copy_fs(
     src_fs,  # type: Union[FS, Text]
     dst_fs,  # type: Union[FS, Text]
@@ -226,7 +252,7 @@ def copy_file_if(
                     _dst_fs,
                     dst_path,
                     preserve_time=preserve_time,
-                    lock=True,
+                    lock=not is_thread_safe(_src_fs, _dst_fs),
                 )
             return do_copy
 
@@ -266,7 +292,11 @@ def copy_file_internal(
     def _copy_locked():
         if dst_fs.hassyspath(dst_path):
             with dst_fs.openbin(dst_path, "w") as write_file:
-                src_fs.download(src_path, write_file)
+                if src_fs.hassyspath(src_path):
+                    with src_fs.openbin(src_path) as read_file:
+                        _copy_local_file_data(read_file, write_file)
+                else:
+                    src_fs.download(src_path, write_file)
         else:
             with src_fs.openbin(src_path) as read_file:
                 dst_fs.upload(dst_path, read_file)
@@ -281,6 +311,48 @@ def copy_file_internal(
         _copy_locked()
 
 
+def _copy_local_file_data(src_file, dst_file):
+    # type: (IO, IO) -> None
+    """Copy data between two files backed by OS files.
+
+    The data is copied in-kernel with `os.sendfile` when the platform
+    supports it for regular files, and with `~fs.tools.copy_file_data`
+    otherwise. Files reporting a size of 0, such as the pseudo-files
+    in ``/proc``, are always copied with `~fs.tools.copy_file_data`.
+
+    Arguments:
+        src_file (io.IOBase): File open for reading, at its start.
+        dst_file (io.IOBase): File open for writing, with nothing
+            written yet.
+
+    """
+    if sendfile is not None:
+        try:
+            fd_src, fd_dst = src_file.fileno(), dst_file.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            pass
+        else:
+            st = os.fstat(fd_src)
+            if stat.S_ISREG(st.st_mode) and st.st_size:
+                # send until EOF rather than up to the size reported by
+                # `fstat`, in case the file grows while being copied
+                count = min(max(st.st_size, 1024 * 1024), 1024 * 1024 * 1024)
+                offset = 0
+                try:
+                    while True:
+                        sent = sendfile(fd_dst, fd_src, offset, count)
+                        if not sent:
+                            break
+                        offset += sent
+                except OSError as e:
+                    # the error is not a simple "sendfile not supported" error
+                    if offset or e.errno not in _SENDFILE_ERROR_CODES:
+                        raise
+                else:
+                    return
+    copy_file_data(src_file, dst_file, chunk_size=1024 * 1024)
+
+
 def copy_structure(
     src_fs,  # type: Union[FS, Text]
     dst_fs,  # type: Union[FS, Text]
@@ -307,7 +379,9 @@ def copy_structure(
         with manage_fs(dst_fs, create=True) as _dst_fs:
             with _src_fs.lock(), _dst_fs.lock():
                 _dst_fs.makedirs(dst_root, recreate=True)
-                for dir_path in walker.dirs(_src_fs, src_root):
+                # a depth-first walk yields directories before their parent,
+                # sorting the paths makes sure parents are created first
+                for dir_path in sorted(walker.dirs(_src_fs, src_root)):
                     _dst_fs.makedir(
                         combine(dst_root, frombase(src_root, dir_path)), recreate=True
                     )
@@ -411,7 +485,8 @@ def copy_dir_if(
         condition (str): Name of the condition to check for each file.
         walker (~fs.walk.Walker, optional): A walker object that will be
             used to scan for files in ``src_fs``. Set this if you only want
-            to consider a sub-set of the resources in ``src_fs``.
+            to consider a sub-set of the resources in ``src_fs``. The
+            resources are listed with `~fs.walk.Walker.info`, in a single walk.
         on_copy (callable):A function callback called after a single file copy
             is executed. Expected signature is ``(src_fs, src_path, dst_fs,
             dst_path)``.
@@ -432,23 +507,40 @@ def copy_dir_if(
 
     from ._bulk import Copier
 
-    copy_structure(src_fs, dst_fs, walker, src_path, dst_path)
-
     with manage_fs(src_fs, writeable=False) as _src_fs, manage_fs(
         dst_fs, create=True
     ) as _dst_fs:
         with _src_fs.lock(), _dst_fs.lock():
             _thread_safe = is_thread_safe(_src_fs, _dst_fs)
+            _dst_fs.makedirs(_dst_path, recreate=True)
+            # source paths of the directories created on the destination
+            created = {_src_path}
+
+            def _makedir(dir_path):
+                # type: (Text) -> None
+                # with a depth-first walk, a directory is only found after
+                # its contents, so its parent may not exist on the destination
+                if dir_path not in created:
+                    copy_path = combine(_dst_path, frombase(_src_path, dir_path))
+                    if dirname(dir_path) in created:
+                        _dst_fs.makedir(copy_path, recreate=True)
+                    else:
+                        _dst_fs.makedirs(copy_path, recreate=True)
+                    created.add(dir_path)
+
             with Copier(
                 num_workers=workers if _thread_safe else 0, preserve_time=preserve_time
             ) as copier:
-                for dir_path in walker.files(_src_fs, _src_path):
-                    copy_path = combine(_dst_path, frombase(_src_path, dir_path))
-                    if _copy_is_necessary(
-                        _src_fs, dir_path, _dst_fs, copy_path, condition
-                    ):
-                        copier.copy(_src_fs, dir_path, _dst_fs, copy_path)
-                        on_copy(_src_fs, dir_path, _dst_fs, copy_path)
+                # create directories and copy files in a single walk
+                for path, info in walker.info(_src_fs, _src_path):
+                    if info.is_dir:
+                        _makedir(path)
+                        continue
+                    _makedir(dirname(path))
+                    copy_path = combine(_dst_path, frombase(_src_path, path))
+                    if _copy_is_necessary(_src_fs, path, _dst_fs, copy_path, condition):
+                        copier.copy(_src_fs, path, _dst_fs, copy_path)
+                        on_copy(_src_fs, path, _dst_fs, copy_path)
 
 
 def _copy_is_necessary(
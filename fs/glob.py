@@ -32,13 +32,17 @@ def _translate_glob(pattern, case_sensitive=True):
     levels = 0
     recursive = False
     re_patterns = [""]
+    groups = wildcard._group_ids()
     for component in iteratepath(pattern):
         if component == "**":
             re_patterns.append(".*/?")
             recursive = True
         else:
             re_patterns.append(
-                "/" + wildcard._translate(component, case_sensitive=case_sensitive)
+                "/"
+                + wildcard._translate(
+                    component, case_sensitive=case_sensitive, groups=groups
+                )
             )
         levels += 1
     re_glob = "(?ms)^" + "".join(re_patterns) + ("/$" if pattern.endswith("/") else "$")
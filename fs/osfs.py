@@ -28,19 +28,11 @@ except ImportError:
     except ImportError:  # pragma: no cover
         scandir = None  # type: ignore  # pragma: no cover
 
-try:
-    from os import sendfile
-except ImportError:
-    try:
-        from sendfile import sendfile  # type: ignore
-    except ImportError:
-        sendfile = None  # type: ignore  # pragma: no cover
-
 from . import errors
 from ._fscompat import fsdecode, fsencode, fspath
 from ._url_tools import url_quote
 from .base import FS
-from .copy import copy_modified_time
+from .copy import _SENDFILE_ERROR_CODES, copy_modified_time, sendfile
 from .enums import ResourceType
 from .error_tools import convert_os_errors
 from .errors import FileExpected, NoURL
@@ -418,19 +410,6 @@ class OSFS(FS):
 
     if sys.version_info[:2] < (3, 8) and sendfile is not None:
 
-        _sendfile_error_codes = {
-            errno.EIO,
-            errno.EINVAL,
-            errno.ENOSYS,
-            errno.EBADF,
-            errno.ENOTSOCK,
-            errno.EOPNOTSUPP,
-        }
-
-        # PyPy doesn't define ENOTSUP so we have to add it conditionally.
-        if hasattr(errno, "ENOTSUP"):
-            _sendfile_error_codes.add(errno.ENOTSUP)
-
         def copy(self, src_path, dst_path, overwrite=False, preserve_time=False):
             # type: (Text, Text, bool, bool) -> None
             with self._lock:
@@ -456,7 +435,7 @@ class OSFS(FS):
                         copy_modified_time(self, src_path, self, dst_path)
                 except OSError as e:
                     # the error is not a simple "sendfile not supported" error
-                    if e.errno not in self._sendfile_error_codes:
+                    if e.errno not in _SENDFILE_ERROR_CODES:
                         raise
                     # fallback using the shutil implementation
                     shutil.copy2(_src_sys, _dst_sys)
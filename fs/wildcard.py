@@ -6,16 +6,31 @@ from __future__ import print_function, unicode_literals
 
 import typing
 
+import itertools
 import re
-from functools import partial
+import sys
 
-from .lrucache import LRUCache
+from ._functoolscompat import lru_cache
 
 if typing.TYPE_CHECKING:
-    from typing import Callable, Iterable, Pattern, Text, Tuple
-
-
-_PATTERN_CACHE = LRUCache(1000)  # type: LRUCache[Tuple[Text, bool], Pattern]
+    from typing import (
+        Callable,
+        Iterable,
+        Iterator,
+        List,
+        Optional,
+        Pattern,
+        Sequence,
+        Text,
+        Tuple,
+    )
+
+
+# Sentinel for a (collapsed) run of `*` in a translated pattern
+_STAR = object()
+# Maximum number of groups in a regex: Python < 3.5 only supports 100,
+# including the implicit group 0 of the whole match
+_MAX_GROUPS = 99 if sys.version_info < (3, 5) else None
 
 
 def match(pattern, name):
@@ -30,12 +45,7 @@ def match(pattern, name):
         bool: `True` if the filename matches the pattern.
 
     """
-    try:
-        re_pat = _PATTERN_CACHE[(pattern, True)]
-    except KeyError:
-        res = "(?ms)" + _translate(pattern) + r"\Z"
-        _PATTERN_CACHE[(pattern, True)] = re_pat = re.compile(res)
-    return re_pat.match(name) is not None
+    return _get_matcher((pattern,), True)(name)
 
 
 def imatch(pattern, name):
@@ -50,12 +60,7 @@ def imatch(pattern, name):
         bool: `True` if the filename matches the pattern.
 
     """
-    try:
-        re_pat = _PATTERN_CACHE[(pattern, False)]
-    except KeyError:
-        res = "(?ms)" + _translate(pattern, case_sensitive=False) + r"\Z"
-        _PATTERN_CACHE[(pattern, False)] = re_pat = re.compile(res, re.IGNORECASE)
-    return re_pat.match(name) is not None
+    return _get_matcher((pattern,), False)(name)
 
 
 def match_any(patterns, name):
@@ -75,7 +80,7 @@ def match_any(patterns, name):
     """
     if not patterns:
         return True
-    return any(match(pattern, name) for pattern in patterns)
+    return _get_matcher(tuple(patterns), True)(name)
 
 
 def imatch_any(patterns, name):
@@ -95,7 +100,7 @@ def imatch_any(patterns, name):
     """
     if not patterns:
         return True
-    return any(imatch(pattern, name) for pattern in patterns)
+    return _get_matcher(tuple(patterns), False)(name)
 
 
 def get_matcher(patterns, case_sensitive):
@@ -122,15 +127,126 @@ def get_matcher(patterns, case_sensitive):
 
     """
     if not patterns:
-        return lambda name: True
+        return _always_true
+    return _get_matcher(tuple(patterns), case_sensitive)
+
+
+def _always_true(name):
+    # type: (Text) -> bool
+    return True
+
+
+@lru_cache(maxsize=1000)
+def _get_matcher(patterns, case_sensitive=True):
+    # type: (Tuple[Text, ...], bool) -> Callable[[Text], bool]
+    """Get a matcher for a tuple of wildcard patterns, using a cache.
+
+    Patterns made of a literal with leading and/or trailing stars,
+    like ``*.py``, are matched with `str` methods instead of a regex,
+    as long as all the patterns have the same shape and the matcher
+    is case sensitive. Case insensitive matchers always use a regex,
+    since lowercasing a name does not fold its case like
+    `re.IGNORECASE` does for every character (e.g. ``"Σ"``).
+
+    Arguments:
+        patterns (tuple): A tuple of wildcard patterns.
+        case_sensitive (bool): Set to `False` to get a case
+            insensitive matcher (default `True`).
+
+    Returns:
+        callable: a matcher that will return `True` if the name given
+        as an argument matches any of the patterns.
+
+    """
+    shapes = set()
+    literals = []
     if case_sensitive:
-        return partial(match_any, patterns)
+        for pattern in patterns:
+            shape = _get_shape(pattern)
+            if shape is None:
+                break
+            shapes.add(shape[0])
+            literals.append(shape[1])
+
+    if len(literals) != len(patterns) or len(shapes) != 1:
+        re_match = _compile_any(patterns, case_sensitive).match
+        return lambda name: re_match(name) is not None
+
+    # The literals never contain a `/`, which `*` does not match,
+    # so a name containing one can only match an exact literal.
+    kind = shapes.pop()
+    affixes = tuple(literals)
+    if kind == "equals":
+        return frozenset(literals).__contains__
+
+    elif kind == "endswith":
+
+        def check(name):
+            # type: (Text) -> bool
+            return "/" not in name and name.endswith(affixes)
+
+    elif kind == "startswith":
+
+        def check(name):
+            # type: (Text) -> bool
+            return "/" not in name and name.startswith(affixes)
+
     else:
-        return partial(imatch_any, patterns)
 
+        def check(name):
+            # type: (Text) -> bool
+            return "/" not in name and any(affix in name for affix in affixes)
+
+    return check
+
+
+def _get_shape(pattern):
+    # type: (Text) -> Optional[Tuple[Text, Text]]
+    """Get the shape of a pattern made of a literal and stars.
 
-def _translate(pattern, case_sensitive=True):
-    # type: (Text, bool) -> Text
+    Arguments:
+        pattern (str): A wildcard pattern.
+
+    Returns:
+        tuple: a ``(kind, literal)`` tuple where ``kind`` is the name of
+        the `str` check equivalent to the pattern, or `None` if the
+        pattern cannot be matched with a `str` method.
+
+    """
+    literal = pattern.strip("*")
+    if any(c in literal for c in "*?[/"):
+        return None
+    if not pattern.startswith("*"):
+        kind = "startswith" if pattern.endswith("*") else "equals"
+    else:
+        kind = "contains" if pattern.endswith("*") else "endswith"
+    return kind, literal
+
+
+def _compile_any(patterns, case_sensitive=True):
+    # type: (Tuple[Text, ...], bool) -> Pattern
+    """Compile wildcard patterns to a single regular expression.
+
+    Arguments:
+        patterns (tuple): A tuple of wildcard patterns.
+        case_sensitive (bool): Set to `False` to get a case
+            insensitive regex (default `True`).
+
+    Returns:
+        ~typing.Pattern: A compiled regex matching the whole name
+        against any of the patterns.
+
+    """
+    groups = _group_ids()
+    res = "|".join(
+        _translate(pattern, case_sensitive=case_sensitive, groups=groups)
+        for pattern in patterns
+    )
+    return re.compile("(?ms)(?:" + res + r")\Z", 0 if case_sensitive else re.IGNORECASE)
+
+
+def _translate(pattern, case_sensitive=True, groups=None):
+    # type: (Text, bool, Optional[Iterator[int]]) -> Text
     """Translate a wildcard pattern to a regular expression.
 
     There is no way to quote meta-characters.
@@ -139,6 +255,9 @@ def _translate(pattern, case_sensitive=True):
         pattern (str): A wildcard pattern.
         case_sensitive (bool): Set to `False` to use a case
             insensitive regex (default `True`).
+        groups (iterator, optional): The ids available for the groups
+            of the regex, shared by all the patterns translated into
+            the same regex (defaults to a new `_group_ids` iterator).
 
     Returns:
         str: A regex equivalent to the given pattern.
@@ -146,15 +265,46 @@ def _translate(pattern, case_sensitive=True):
     """
     if not case_sensitive:
         pattern = pattern.lower()
+    if groups is None:
+        groups = _group_ids()
+    return _join_translated(_tokenize(pattern), groups)
+
+
+def _group_ids():
+    # type: () -> Iterator[int]
+    """Get an iterator over the group ids available in a regex."""
+    if _MAX_GROUPS is None:
+        return itertools.count()
+    return iter(range(_MAX_GROUPS))
+
+
+def _tokenize(pattern):
+    # type: (Text) -> Tuple[object, ...]
+    """Split a wildcard pattern into regex pieces.
+
+    Arguments:
+        pattern (str): A wildcard pattern.
+
+    Returns:
+        tuple: the regex pieces of the pattern, with `_STAR` standing
+        for each run of ``*``.
+
+    """
     i, n = 0, len(pattern)
-    res = ""
+    res = []  # type: List[object]
+    add = res.append
     while i < n:
         c = pattern[i]
         i = i + 1
         if c == "*":
-            res = res + "[^/]*"
+            # A run of `*` is equivalent to a single one, and emitting
+            # `[^/]*[^/]*` would make the regex engine backtrack through
+            # every way of splitting the text between the two.
+            while i < n and pattern[i] == "*":
+                i = i + 1
+            add(_STAR)
         elif c == "?":
-            res = res + "."
+            add(".")
         elif c == "[":
             j = i
             if j < n and pattern[j] == "!":
@@ -164,7 +314,7 @@ def _translate(pattern, case_sensitive=True):
             while j < n and pattern[j] != "]":
                 j = j + 1
             if j >= n:
-                res = res + "\\["
+                add("\\[")
             else:
                 stuff = pattern[i:j].replace("\\", "\\\\")
                 i = j + 1
@@ -172,7 +322,52 @@ def _translate(pattern, case_sensitive=True):
                     stuff = "^" + stuff[1:]
                 elif stuff[0] == "^":
                     stuff = "\\" + stuff
-                res = "%s[%s]" % (res, stuff)
+                add("[%s]" % stuff)
+        else:
+            # Escape a whole run of literal characters at once, stopping
+            # at any `/` so that it stays a piece of its own.
+            j = i
+            if c != "/":
+                while j < n and pattern[j] not in "*?[/":
+                    j = j + 1
+            add(re.escape(pattern[i - 1 : j]))
+            i = j
+    return tuple(res)
+
+
+def _join_translated(res, groups):
+    # type: (Sequence[object], Iterator[int]) -> Text
+    """Join the pieces of a translated pattern into a regex.
+
+    Every `*` followed by a fixed part is matched with an atomic group
+    emulated with a lookahead and a backreference, as done by `fnmatch`
+    since Python 3.9. The lookahead finds the first occurrence of the
+    fixed part, and the engine never backtracks into it, which bounds
+    the cost of matching patterns like ``*a*a*a*b`` that would
+    otherwise take exponential time. Taking the first occurrence is
+    only correct if the fixed part cannot match a ``/``, so other
+    fixed parts are left to the regular (greedy) wildcard, as are all
+    the fixed parts once ``groups`` is exhausted.
+
+    """
+    out = []  # type: List[Text]
+    add = out.append
+    i, n = 0, len(res)
+    while i < n and res[i] is not _STAR:
+        add(typing.cast("Text", res[i]))
+        i = i + 1
+    while i < n:
+        i = i + 1
+        fixed = []  # type: List[Text]
+        while i < n and res[i] is not _STAR:
+            fixed.append(typing.cast("Text", res[i]))
+            i = i + 1
+        group = None
+        if i < n and not any(re.match(piece, "/") for piece in fixed):
+            group = next(groups, None)
+        if group is None:
+            add("[^/]*")
+            out.extend(fixed)
         else:
-            res = res + re.escape(c)
-    return res
+            add("(?=(?P<g{0}>[^/]*?{1}))(?P=g{0})".format(group, "".join(fixed)))
+    return "".join(out)
@@ -9,9 +9,24 @@ import tempfile
 import unittest
 from parameterized import parameterized
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 import fs.copy
+import fs.walk
 from fs import open_fs
 
+_fstat = os.fstat
+
+
+def _fstat_zero_size(fd):
+    # report a size of 0, like pseudo-files do
+    st = list(_fstat(fd))
+    st[6] = 0
+    return os.stat_result(st)
+
 
 def _create_sandbox_dir(prefix="pyfilesystem2_sandbox_", home=None):
     if home is None:
@@ -133,6 +148,36 @@ class TestCopySimple(unittest.TestCase):
             dst_file2_info = dst_fs.getinfo("bar/baz.txt", namespaces)
             self.assertEqual(dst_file2_info.modified, src_file2_info.modified)
 
+    @parameterized.expand([("breadth",), ("depth",)])
+    def test_copy_dir_search(self, search):
+        src_fs = open_fs("mem://")
+        src_fs.makedirs("foo/bar/baz")
+        src_fs.makedirs("foo/empty")
+        src_fs.writetext("foo/test.txt", "test")
+        src_fs.writetext("foo/bar/baz/egg.txt", "egg")
+
+        with open_fs("mem://") as dst_fs:
+            walker = fs.walk.Walker(search=search)
+            fs.copy.copy_dir(src_fs, "/foo", dst_fs, "/copy", walker=walker)
+            self.assertTrue(dst_fs.isdir("copy/empty"))
+            self.assertTrue(dst_fs.isdir("copy/bar/baz"))
+            self.assertEqual(dst_fs.readtext("copy/test.txt"), "test")
+            self.assertEqual(dst_fs.readtext("copy/bar/baz/egg.txt"), "egg")
+
+    @parameterized.expand([("breadth",), ("depth",)])
+    def test_copy_structure_search(self, search):
+        src_fs = open_fs("mem://")
+        src_fs.makedirs("foo/bar/baz")
+        src_fs.makedirs("foo/empty")
+        src_fs.touch("foo/test.txt")
+
+        with open_fs("mem://") as dst_fs:
+            walker = fs.walk.Walker(search=search)
+            fs.copy.copy_structure(src_fs, dst_fs, walker=walker)
+            self.assertTrue(dst_fs.isdir("foo/empty"))
+            self.assertTrue(dst_fs.isdir("foo/bar/baz"))
+            self.assertFalse(dst_fs.exists("foo/test.txt"))
+
     def test_copy_large(self):
         data1 = b"foo" * 512 * 1024
         data2 = b"bar" * 2 * 512 * 1024
@@ -151,6 +196,80 @@ class TestCopySimple(unittest.TestCase):
                     self.assertEqual(dst_fs.readbytes("dir1/baz"), data3)
                     self.assertEqual(dst_fs.readbytes("dir2/dir3/egg"), data4)
 
+    @unittest.skipUnless(fs.copy.sendfile, "sendfile not supported")
+    def test_copy_file_sendfile(self):
+        data = b"foo" * 512 * 1024
+        with open_fs("temp://") as src_fs, open_fs("temp://") as dst_fs:
+            src_fs.writebytes("foo", data)
+            with mock.patch.object(
+                fs.copy, "sendfile", wraps=fs.copy.sendfile
+            ) as sendfile:
+                fs.copy.copy_file(src_fs, "foo", dst_fs, "foo")
+            self.assertTrue(sendfile.called)
+            self.assertEqual(dst_fs.readbytes("foo"), data)
+            # check the copy falls back if sendfile is not supported
+            with mock.patch.object(fs.copy, "sendfile") as sendfile:
+                sendfile.side_effect = OSError(errno.ENOSYS, "sendfile not supported")
+                fs.copy.copy_file(src_fs, "foo", dst_fs, "bar")
+            self.assertEqual(dst_fs.readbytes("bar"), data)
+            # check other errors are transmitted
+            with mock.patch.object(fs.copy, "sendfile") as sendfile:
+                sendfile.side_effect = OSError(errno.EWOULDBLOCK)
+                with self.assertRaises(OSError):
+                    fs.copy.copy_file(src_fs, "foo", dst_fs, "baz")
+
+    @unittest.skipUnless(fs.copy.sendfile, "sendfile not supported")
+    def test_copy_fs_sendfile_workers(self):
+        data = b"foo" * 512 * 1024
+        with open_fs("temp://") as src_fs, open_fs("temp://") as dst_fs:
+            src_fs.writebytes("foo", data)
+            src_fs.makedir("bar").writebytes("baz", data)
+            with mock.patch.object(
+                fs.copy, "sendfile", wraps=fs.copy.sendfile
+            ) as sendfile:
+                fs.copy.copy_fs(src_fs, dst_fs, workers=2)
+            self.assertTrue(sendfile.called)
+            self.assertEqual(dst_fs.readbytes("foo"), data)
+            self.assertEqual(dst_fs.readbytes("bar/baz"), data)
+
+    @unittest.skipUnless(os.path.isfile("/proc/self/status"), "no /proc filesystem")
+    def test_copy_file_proc(self):
+        with open_fs("/proc/self") as src_fs, open_fs("temp://") as dst_fs:
+            fs.copy.copy_file(src_fs, "status", dst_fs, "status")
+            self.assertTrue(dst_fs.readtext("status").startswith("Name:"))
+
+    @unittest.skipUnless(fs.copy.sendfile, "sendfile not supported")
+    def test_copy_file_sendfile_zero_size(self):
+        data = b"foo" * 512 * 1024
+        with open_fs("temp://") as src_fs, open_fs("temp://") as dst_fs:
+            src_fs.writebytes("foo", data)
+            with mock.patch.object(fs.copy.os, "fstat", _fstat_zero_size):
+                fs.copy.copy_file(src_fs, "foo", dst_fs, "foo")
+            self.assertEqual(dst_fs.readbytes("foo"), data)
+
+    @unittest.skipUnless(fs.copy.sendfile, "sendfile not supported")
+    def test_copy_dir_sendfile_zero_size_workers(self):
+        data = b"foo" * 512 * 1024
+        with open_fs("temp://") as src_fs, open_fs("temp://") as dst_fs:
+            src_fs.makedir("foo").writebytes("bar", data)
+            src_fs.writebytes("foo/baz", data)
+            with mock.patch.object(fs.copy.os, "fstat", _fstat_zero_size):
+                fs.copy.copy_dir(src_fs, "foo", dst_fs, "foo", workers=2)
+            self.assertEqual(dst_fs.readbytes("foo/bar"), data)
+            self.assertEqual(dst_fs.readbytes("foo/baz"), data)
+
+    def test_copy_file_thread_safe(self):
+        src_fs = open_fs("mem://")
+        src_fs.writetext("foo", "bar")
+        dst_fs = open_fs("mem://")
+        with mock.patch.object(src_fs, "lock") as src_lock, mock.patch.object(
+            dst_fs, "lock"
+        ) as dst_lock:
+            fs.copy.copy_file(src_fs, "foo", dst_fs, "foo")
+        self.assertEqual(dst_fs.readtext("foo"), "bar")
+        self.assertFalse(src_lock.called)
+        self.assertFalse(dst_lock.called)
+
     def test_copy_dir_on_copy(self):
         src_fs = open_fs("mem://")
         src_fs.touch("baz.txt")
@@ -4,6 +4,13 @@ from __future__ import unicode_literals
 
 import unittest
 
+import six
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 from fs import wildcard
 
 
@@ -29,11 +36,77 @@ class TestFNMatch(unittest.TestCase):
         self.assertTrue(wildcard.imatch("*.py", "FILE.py"))
         self.assertTrue(wildcard.imatch("*.py", "file.PY"))
 
+    def test_wildcard_consecutive_stars(self):
+        self.assertTrue(wildcard.match("**.py", "file.py"))
+        self.assertTrue(wildcard.match("**foo**bar", "xfooybar"))
+        self.assertTrue(wildcard.match("**foo**bar", "foobar"))
+        self.assertFalse(wildcard.match("**foo**bar", "foo/bar"))
+        self.assertFalse(wildcard.match("**a**a**a**a**b", "a" * 40))
+
+    def test_wildcard_backtracking(self):
+        self.assertTrue(wildcard.match("*a*b*c", "xxaxxbxxc"))
+        self.assertTrue(wildcard.match("*a*a", "aaa"))
+        self.assertFalse(wildcard.match("*a*a", "a/a"))
+        self.assertTrue(wildcard.match("*?x*", "a/x"))
+        self.assertTrue(wildcard.match("*[!a]b*", "a/b"))
+        self.assertTrue(wildcard.imatch("*A*b", "xaxB"))
+        self.assertTrue(wildcard.match_any(["*a*b", "*b*a"], "xbxa"))
+        self.assertFalse(wildcard.match("*a*a*a*a*a*a*a*a*b", "a" * 100))
+
+    def test_wildcard_many_patterns(self):
+        patterns = ["*a{}*b".format(i) for i in range(120)]
+        self.assertTrue(wildcard.match_any(patterns, "xa119yb"))
+        self.assertFalse(wildcard.match_any(patterns, "xa119y"))
+        with mock.patch.object(wildcard, "_MAX_GROUPS", 99):
+            regex = wildcard._compile_any(tuple(patterns))
+            self.assertLessEqual(regex.groups, 99)
+            self.assertTrue(regex.match("xa119yb"))
+            self.assertFalse(regex.match("xa119/b"))
+
+    def test_wildcard_case_insensitive_classes(self):
+        self.assertTrue(wildcard.match("*a*[b-c]", "xaxb"))
+        self.assertTrue(wildcard.imatch("*a*[b-c]", "XAXB"))
+        self.assertTrue(wildcard.imatch("*A*[B-C]", "xaxb"))
+        self.assertTrue(wildcard.imatch("[a-Z]*.txt", "Foo.txt"))
+        self.assertTrue(wildcard.imatch_any(["[a-Z]*", "*.py"], "Foo.txt"))
+        self.assertTrue(wildcard.match_any(["*a*b", "*a*b"], "xaxb"))
+
+    def test_wildcard_literal_shapes(self):
+        self.assertTrue(wildcard.match("*.py", ".py"))
+        self.assertFalse(wildcard.match("*.py", "foo/bar.py"))
+        self.assertTrue(wildcard.match("__pycache__*", "__pycache__"))
+        self.assertFalse(wildcard.match("foo*", "foo/bar"))
+        self.assertTrue(wildcard.match("*test*", "my_test.py"))
+        self.assertFalse(wildcard.match("*test*", "test/foo"))
+        self.assertTrue(wildcard.match("*", "foo"))
+        self.assertFalse(wildcard.match("*", "foo/bar"))
+        self.assertTrue(wildcard.imatch("README*", "readme.md"))
+        self.assertTrue(wildcard.imatch("*Test*", "MYTEST.PY"))
+        self.assertTrue(wildcard.imatch("Setup.py", "setup.PY"))
+        self.assertFalse(wildcard.imatch("*Test*", "test/foo"))
+        self.assertFalse(wildcard.imatch("*.PY", "foo/bar.py"))
+        self.assertTrue(wildcard.match_any(["foo", "bar"], "bar"))
+        self.assertFalse(wildcard.match_any(["foo", "bar"], "baz"))
+        self.assertTrue(wildcard.match_any(["*.py", "foo*"], "foo.txt"))
+
+    @unittest.skipIf(six.PY2, "re.IGNORECASE only folds ASCII on Python 2")
+    def test_wildcard_literal_shapes_unicode(self):
+        self.assertTrue(wildcard.imatch("*.\u03c3", "A.\u03a3"))
+        self.assertTrue(
+            wildcard.imatch("\u039f\u0394\u039f\u03a3", "\u03bf\u03b4\u03bf\u03c3")
+        )
+        self.assertTrue(wildcard.imatch("*\u017f", "the_s"))
+
     def test_match_any(self):
         self.assertTrue(wildcard.match_any([], "foo.py"))
         self.assertTrue(wildcard.imatch_any([], "foo.py"))
         self.assertTrue(wildcard.match_any(["*.py", "*.pyc"], "foo.pyc"))
         self.assertTrue(wildcard.imatch_any(["*.py", "*.pyc"], "FOO.pyc"))
+        self.assertTrue(wildcard.match_any(["*.py", "foo.*"], "foo.txt"))
+        self.assertFalse(wildcard.match_any(["*.py", "*.pyc"], "foo.txt"))
+        self.assertFalse(wildcard.match_any(["*.py", "*.pyc"], "foo.PY"))
+        self.assertFalse(wildcard.match_any(["*.py", "*.pyc"], "foo.pycx"))
+        self.assertFalse(wildcard.imatch_any(["*.py", "*.pyc"], "FOO.txt"))
 
     def test_get_matcher(self):
         matcher = wildcard.get_matcher([], True)
@@ -44,3 +117,6 @@ class TestFNMatch(unittest.TestCase):
         matcher = wildcard.get_matcher(["*.py"], False)
         self.assertTrue(matcher("foo.py"))
         self.assertTrue(matcher("FOO.py"))
+        matcher = wildcard.get_matcher(["*.py", "*.pyc"], True)
+        self.assertTrue(matcher("foo.pyc"))
+        self.assertFalse(matcher("foo.txt"))